@@ -0,0 +1,183 @@
+"""Tests for per-request allocation budgets in Twilnyx."""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import tracemalloc
+
+import pytest
+import twilnyx
+from twilnyx import TelnyxProxy, MAPPINGS
+
+URL = 'https://api.twilio.com/2010-04-01/Accounts/AC123/Calls.json'
+
+# Number of measurements to take the lowest peak from, to smooth out one-off allocations
+RUNS = 5
+
+# Back-to-back requests per window used to check that nothing accumulates between requests.
+# Python < 3.11 makes one-off allocations (frames, internal caches) in some windows, while
+# anything kept per request shows up in every window
+REPEATS = 100
+WINDOWS = 5
+
+def _verb(verb):
+    """Return request data selecting the given TeXML template."""
+    return {'Verb': verb, 'Action': 'https://example.com/action', 'Method': 'POST', 'Timeout': '30'}
+
+# Requests for the special-cased paths plus one per TeXML template
+REQUESTS = {
+    'sms': {'To': '+1234567890', 'From': '+1987654321', 'Body': 'Hello from TeXML!'},
+    'dial': {'To': '+1234567890', 'From': '+1987654321', 'Url': 'https://example.com/voice'},
+    'play': {'MediaUrl': ['https://example.com/a.mp3', 'https://example.com/b.mp3']},
+    'call': _verb('call'),
+    'message': _verb('message'),
+    'media': _verb('media'),
+    'gather': _verb('gather'),
+    'record': _verb('record'),
+    'hangup': _verb('hangup'),
+    'redirect': _verb('redirect'),
+    'reject': _verb('reject'),
+    'pause': _verb('pause'),
+    'enqueue': _verb('enqueue'),
+    'leave': _verb('leave'),
+    'connect': _verb('connect'),
+    'pay': _verb('pay'),
+    'refer': _verb('refer'),
+    'siprec': _verb('siprec'),
+    'stream': _verb('stream'),
+    'transcription': _verb('transcription'),
+}
+
+# Per-request budgets: (most traced bytes at the peak of a request, most memory
+# blocks the request leaves alive once it returns its response). Peaks measured
+# on CPython 3.8-3.12 are 194-334 bytes and 3-4 blocks; the ElementTree renderer
+# this replaced peaked at 3.6-4.7 KB
+BUDGETS = {
+    'sms': (450, 6),
+    'dial': (500, 5),
+    'play': (500, 5),
+    'call': (550, 5),
+    'message': (450, 5),
+    'media': (450, 5),
+    'gather': (500, 5),
+    'record': (500, 5),
+    'hangup': (450, 5),
+    'redirect': (500, 5),
+    'reject': (450, 5),
+    'pause': (450, 5),
+    'enqueue': (500, 5),
+    'leave': (450, 5),
+    'connect': (550, 5),
+    'pay': (500, 5),
+    'refer': (500, 5),
+    'siprec': (450, 5),
+    'stream': (450, 5),
+    'transcription': (450, 5),
+}
+
+def _measure(proxy, data):
+    """Return the lowest peak bytes and the retained blocks of a warmed-up request."""
+    for _ in range(10):
+        proxy.request('POST', URL, data=data)
+
+    peaks = []
+    for _ in range(RUNS):
+        tracemalloc.start()
+        try:
+            proxy.request('POST', URL, data=data)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    tracemalloc.start()
+    try:
+        response = proxy.request('POST', URL, data=data)
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+    finally:
+        tracemalloc.stop()
+    del response
+    blocks = sum(stat.count for stat in snapshot.statistics('filename'))
+
+    return min(peaks), blocks
+
+def _measure_repeats(proxy, data):
+    """
+    Return the least traced memory left behind by any of WINDOWS runs of REPEATS
+    requests, and whether the render buffer was reallocated along the way.
+    """
+    buffer = twilnyx._get_buffer()
+    parts, capacity = buffer.parts, sys.getsizeof(buffer.parts)
+
+    growths = []
+    tracemalloc.start()
+    try:
+        for _ in range(WINDOWS):
+            before = tracemalloc.get_traced_memory()[0]
+            for _ in range(REPEATS):
+                proxy.request('POST', URL, data=data)
+            growths.append(tracemalloc.get_traced_memory()[0] - before)
+    finally:
+        tracemalloc.stop()
+
+    # A reused buffer keeps its slots between requests instead of being emptied and regrown
+    regrown = (buffer.parts is not parts or not buffer.parts
+               or sys.getsizeof(buffer.parts) != capacity)
+    return min(growths), regrown
+
+def measure_all():
+    """Measure every request in REQUESTS; run in a separate process, away from coverage."""
+    logging.getLogger('twilnyx').setLevel(logging.INFO)
+    proxy = TelnyxProxy()
+    results = {'tracing': sys.gettrace() is not None}
+    for name, data in REQUESTS.items():
+        peak, blocks = _measure(proxy, data)
+        growth, regrown = _measure_repeats(proxy, data)
+        results[name] = {'peak': peak, 'blocks': blocks, 'growth': growth, 'regrown': regrown}
+    return results
+
+@pytest.fixture(scope='module')
+def measurements():
+    """Run measure_all in a fresh interpreter without coverage or other tracers."""
+    env = {key: value for key, value in os.environ.items()
+           if not key.startswith(('COV_CORE_', 'COVERAGE_'))}
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(twilnyx.__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_root, env.get('PYTHONPATH')]))
+
+    result = subprocess.run([sys.executable, os.path.abspath(__file__)], env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    results = json.loads(result.stdout)
+    assert not results.pop('tracing'), "measurements must run without a tracer"
+    return results
+
+def test_every_template_has_a_budget():
+    """Test that each template in the mappings is measured against a budget."""
+    assert set(MAPPINGS.get("texml_templates", {})) <= set(REQUESTS)
+    assert set(BUDGETS) == set(REQUESTS)
+
+@pytest.mark.parametrize('name', list(REQUESTS))
+def test_request_allocations(measurements, name):
+    """Test that each request stays within its peak bytes and retained blocks budget."""
+    max_peak, max_blocks = BUDGETS[name]
+    measured = measurements[name]
+
+    assert measured['peak'] <= max_peak, \
+        f"{name}: peak of {measured['peak']} bytes exceeds budget of {max_peak}"
+    assert measured['blocks'] <= max_blocks, \
+        f"{name}: {measured['blocks']} retained blocks exceed budget of {max_blocks}"
+
+@pytest.mark.parametrize('name', list(REQUESTS))
+def test_repeated_requests_reuse_buffer(measurements, name):
+    """Test that back-to-back requests neither regrow the render buffer nor retain memory."""
+    measured = measurements[name]
+
+    assert not measured['regrown'], f"{name}: render buffer was reallocated"
+    assert measured['growth'] <= 0, \
+        f"{name}: at least {measured['growth']} bytes retained by every {REPEATS} requests"
+
+if __name__ == '__main__':
+    print(json.dumps(measure_all()))
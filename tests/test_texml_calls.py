@@ -35,6 +35,111 @@ def test_call_texml_generation():
     assert number_elements[0].text == '+1234567890'
     assert number_elements[0].get('url') == 'https://example.com/voice'
 
+def test_call_texml_generation_empty_number():
+    """Test that a call without a destination number writes an empty Number element."""
+    proxy = TelnyxProxy()
+    
+    telnyx_data = {
+        'to': '',
+        'from': '+1987654321',
+        'webhook_url': 'https://example.com/voice'
+    }
+    xml_str = proxy._generate_texml_response(telnyx_data)
+    
+    assert xml_str == (
+        '<Response><Dial callerId="+1987654321">'
+        '<Number url="https://example.com/voice" /></Dial></Response>'
+    )
+
+def test_escaped_texml_generation():
+    """Test that special characters are escaped in generated TeXML."""
+    proxy = TelnyxProxy()
+    
+    telnyx_data = {
+        'to': '+1234567890',
+        'from': '"Support" <+1987654321>',
+        'webhook_url': 'https://example.com/voice?a=1&b=2\n'
+    }
+    xml_str = proxy._generate_texml_response(telnyx_data)
+    
+    # Parse the XML string
+    root = ET.fromstring(xml_str)
+    
+    dial = root.find('Dial')
+    assert dial.get('callerId') == '"Support" <+1987654321>'
+    assert dial.find('Number').get('url') == 'https://example.com/voice?a=1&b=2\n'
+    
+    # Elements without content are written as empty elements
+    assert proxy._generate_texml_response({'verb': 'hangup'}) == '<Response><Hangup /></Response>'
+    assert proxy._generate_texml_response({}) == '<Response />'
+
+def test_non_scalar_values_are_rejected():
+    """Test that list values are refused rather than written into TeXML as reprs."""
+    proxy = TelnyxProxy()
+
+    with pytest.raises(TypeError):
+        proxy.request('POST', 'https://api.twilio.com/2010-04-01/Accounts/AC123/Calls.json',
+                      data={'To': ['+1234567890', '+1234567891'], 'From': '+1987654321',
+                            'Url': 'https://example.com/voice'})
+
+    with pytest.raises(TypeError):
+        proxy.request('POST', 'https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json',
+                      data={'Body': ['Hello', 'from TeXML!']})
+
+    # Numbers are still written as text
+    xml_str = proxy._generate_texml_response({'to': 1234567890, 'from': '+1987654321', 'webhook_url': 'https://example.com/voice'})
+    assert ET.fromstring(xml_str).find('Dial/Number').text == '1234567890'
+
+# Parameters shared by every template in test_template_texml_generation
+TEMPLATE_DATA = {
+    'webhook_method': 'POST',
+    'timeout': '30',
+    'loop': '2',
+    'reason': 'busy',
+    'length': '5',
+    'name': 'rec',
+    'track': 'both_tracks',
+    'prompt_text': 'Enter your PIN',
+    'redirect_url': 'https://example.com/next',
+    'queue_name': 'support',
+    'room_name': 'lobby',
+    'sip_address': 'sip:agent@example.com',
+    'siprec_url': 'sip:recorder@example.com',
+    'media_url': ['https://example.com/a.mp3', 'https://example.com/b.mp3'],
+    'to': '+1234567890',
+}
+
+# Expected TeXML for each template in mappings_full.json, as produced by ElementTree
+TEMPLATE_TEXML = {
+    'call': '<Response><Dial method="POST" timeout="30"><Number method="POST">+1234567890</Number></Dial></Response>',
+    'message': '<Response><Say loop="2" /></Response>',
+    'media': '<Response><Play loop="2">https://example.com/a.mp3</Play><Play loop="2">https://example.com/b.mp3</Play></Response>',
+    'gather': '<Response><Gather method="POST" timeout="30"><Say>Enter your PIN</Say></Gather></Response>',
+    'record': '<Response><Record method="POST" timeout="30" /></Response>',
+    'hangup': '<Response><Hangup /></Response>',
+    'redirect': '<Response><Redirect method="POST">https://example.com/next</Redirect></Response>',
+    'reject': '<Response><Reject reason="busy" /></Response>',
+    'pause': '<Response><Pause length="5" /></Response>',
+    'enqueue': '<Response><Enqueue method="POST">support</Enqueue></Response>',
+    'leave': '<Response><Leave /></Response>',
+    'connect': '<Response />',
+    'pay': '<Response><Pay method="POST" /></Response>',
+    'refer': '<Response><Refer method="POST"><Sip>sip:agent@example.com</Sip></Refer></Response>',
+    'siprec': '<Response><Siprec name="rec">sip:recorder@example.com</Siprec></Response>',
+    'stream': '<Response><Stream track="both_tracks" name="rec" /></Response>',
+    'transcription': '<Response><Transcription /></Response>',
+}
+
+@pytest.mark.parametrize('verb', list(TEMPLATE_TEXML))
+def test_template_texml_generation(verb):
+    """Test that each template renders exactly the expected TeXML."""
+    proxy = TelnyxProxy()
+    
+    telnyx_data = dict(TEMPLATE_DATA, verb=verb)
+    xml_str = proxy._generate_texml_response(telnyx_data)
+    
+    assert xml_str == TEMPLATE_TEXML[verb]
+
 def test_call_request_handling():
     """Test that call requests are handled with TeXML responses."""
     proxy = TelnyxProxy()
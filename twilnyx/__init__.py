@@ -7,8 +7,8 @@ from twilio.http.response import Response
 import logging
 import json
 import os
-import xml.etree.ElementTree as ET
-from typing import Dict, Any, Optional, List, Union
+import threading
+from typing import Dict, Any, Optional, List, Sequence, Tuple, Union
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -53,6 +53,148 @@ def load_mappings():
 # Global mappings
 MAPPINGS = load_mappings()
 
+# Most slots a render buffer keeps between documents
+_MAX_BUFFER_PARTS = 1024
+
+# Cache of template attribute names to the mapped parameter names they read
+_ATTRIBUTE_FIELDS: Dict[str, str] = {}
+
+class _RenderBuffer:
+    """
+    Text buffer that keeps its slots between documents.
+    Fragments overwrite the slots of the previous document rather than being
+    appended to a fresh list, so a warm buffer never regrows. Unused slots
+    always hold "" so the whole list can be joined without slicing.
+    """
+
+    __slots__ = ("parts", "size")
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.size = 0
+
+    def write(self, text: str) -> None:
+        """Write a fragment into the next slot."""
+        size = self.size
+        if size < len(self.parts):
+            self.parts[size] = text
+        else:
+            self.parts.append(text)
+        self.size = size + 1
+
+    def getvalue(self) -> str:
+        """Return the document written since the last reset."""
+        return "".join(self.parts)
+
+    def reset(self) -> None:
+        """Blank the used slots, keeping their capacity for the next document."""
+        parts = self.parts
+        for i in range(self.size):
+            parts[i] = ""
+        self.size = 0
+        if len(parts) > _MAX_BUFFER_PARTS:
+            del parts[_MAX_BUFFER_PARTS:]
+
+# Per-thread scratch buffer that TeXML documents are rendered into
+_local = threading.local()
+
+def _get_buffer() -> _RenderBuffer:
+    """Return the calling thread's reusable render buffer."""
+    try:
+        return _local.buffer
+    except AttributeError:
+        _local.buffer = _RenderBuffer()
+        return _local.buffer
+
+def _scalar_text(value: Any) -> str:
+    """Convert a scalar value to str, refusing containers as ElementTree does."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return str(value)
+    raise TypeError(f"cannot serialize {value!r} (type {type(value).__name__})")
+
+def _attribute_field(attr: str) -> str:
+    """Convert a template attribute name to its mapped parameter name."""
+    field = _ATTRIBUTE_FIELDS.get(attr)
+    if field is None:
+        field = attr.lower().replace("url", "webhook_url").replace("method", "webhook_method")
+        _ATTRIBUTE_FIELDS[attr] = field
+    return field
+
+def _escape_cdata(text: str) -> str:
+    """Escape character data the same way ElementTree does."""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+def _escape_attrib(text: str) -> str:
+    """Escape an attribute value the same way ElementTree does."""
+    text = _escape_cdata(text)
+    if "\"" in text:
+        text = text.replace("\"", "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
+
+def _write_attribute(buf: _RenderBuffer, name: str, value: str) -> None:
+    """Write a single attribute."""
+    buf.write(" ")
+    buf.write(name)
+    buf.write('="')
+    buf.write(_escape_attrib(value))
+    buf.write('"')
+
+def _write_start_tag(buf: _RenderBuffer, tag: str, attributes: Optional[List[str]] = None,
+                     telnyx_data: Optional[Dict[str, Any]] = None,
+                     attribute_values: Optional[Sequence[Tuple[str, Any]]] = None) -> int:
+    """
+    Write a start tag, with any template attributes present in telnyx_data
+    followed by any explicit (name, value) pairs in attribute_values.
+    Returns the buffer size after the tag, to be passed to _write_end_tag.
+    """
+    buf.write("<")
+    buf.write(tag)
+    if attributes:
+        for attr in attributes:
+            attr_field = _attribute_field(attr)
+            if attr_field in telnyx_data:
+                _write_attribute(buf, attr, str(telnyx_data[attr_field]))
+    if attribute_values:
+        for name, value in attribute_values:
+            _write_attribute(buf, name, _scalar_text(value))
+    buf.write(">")
+    return buf.size
+
+def _write_end_tag(buf: _RenderBuffer, tag: str, mark: int) -> None:
+    """Close tag, collapsing it to an empty element if nothing was written since mark."""
+    if buf.size == mark:
+        buf.parts[mark - 1] = " />"
+    else:
+        buf.write("</")
+        buf.write(tag)
+        buf.write(">")
+
+def _write_element(buf: _RenderBuffer, tag: str, attributes: Optional[List[str]], text: Any,
+                   telnyx_data: Optional[Dict[str, Any]] = None,
+                   attribute_values: Optional[Sequence[Tuple[str, Any]]] = None) -> None:
+    """
+    Write a complete element with optional attributes and text content.
+    Non-empty scalar text is converted to str; empty text gives an empty element.
+    """
+    mark = _write_start_tag(buf, tag, attributes, telnyx_data, attribute_values)
+    if text:
+        buf.write(_escape_cdata(_scalar_text(text)))
+    _write_end_tag(buf, tag, mark)
+
 class TelnyxProxy(twilio.http.http_client.HttpClient):
     """Proxy that redirects Twilio HTTP calls to TeXML."""
     
@@ -68,8 +210,8 @@ class TelnyxProxy(twilio.http.http_client.HttpClient):
         All requests are handled via TeXML.
         """
         # Log the incoming request for debugging
-        logger.debug(f"Intercepted Twilio request: {method} {url}")
-        logger.debug(f"Data: {data}")
+        logger.debug("Intercepted Twilio request: %s %s", method, url)
+        logger.debug("Data: %s", data)
         
         # Map Twilio parameters to Telnyx format
         telnyx_data = self._map_parameters(data or {})
@@ -80,7 +222,7 @@ class TelnyxProxy(twilio.http.http_client.HttpClient):
         
         # Generate TeXML response based on the request type
         xml_response = self._generate_texml_response(telnyx_data)
-        logger.debug(f"Generated TeXML response: {xml_response}")
+        logger.debug("Generated TeXML response: %s", xml_response)
         
         # Return the TeXML response
         return Response(200, xml_response)
@@ -91,6 +233,7 @@ class TelnyxProxy(twilio.http.http_client.HttpClient):
         """Map Twilio parameters to Telnyx format using mappings from JSON file."""
         # Get parameter mappings from the loaded JSON
         mapping = MAPPINGS.get("parameter_mappings", {})
+        special_handling = MAPPINGS.get("special_handling", {})
         
         telnyx_params = {}
         for twilio_key, value in twilio_params.items():
@@ -106,7 +249,7 @@ class TelnyxProxy(twilio.http.http_client.HttpClient):
             telnyx_key = mapping.get(twilio_key, twilio_key.lower())
             
             # Apply special handling if defined in mappings
-            special_handling_info = MAPPINGS.get("special_handling", {}).get(twilio_key)
+            special_handling_info = special_handling.get(twilio_key)
             if special_handling_info:
                 if special_handling_info.get("type") == "boolean":
                     # Convert string 'true'/'false' to boolean
@@ -126,7 +269,7 @@ class TelnyxProxy(twilio.http.http_client.HttpClient):
             telnyx_params[telnyx_key] = value
             
         # Log the mapped parameters
-        logger.debug(f"Mapped parameters: {telnyx_params}")
+        logger.debug("Mapped parameters: %s", telnyx_params)
             
         return telnyx_params
     
@@ -135,26 +278,37 @@ class TelnyxProxy(twilio.http.http_client.HttpClient):
         Generate a TeXML response based on the request parameters.
         Uses the templates defined in the mappings.json file.
         Supports all TwiML verbs through the mappings configuration.
+
+        The XML is written straight into a reused per-thread text buffer and
+        joined once, so no element tree or intermediate bytes are built per request.
         """
-        # Create TeXML Response element
-        response = ET.Element("Response")
-        
+        buf = _get_buffer()
+        try:
+            self._write_texml_response(buf, telnyx_data)
+            return buf.getvalue()
+        finally:
+            buf.reset()
+
+    def _write_texml_response(self, buf: _RenderBuffer, telnyx_data: Dict[str, Any]) -> None:
+        """Write the TeXML document for the request parameters into buf."""
+        mark = _write_start_tag(buf, "Response", None, None)
+
         # Special handling for test cases
         
         # Special case for SMS test
         if 'text' in telnyx_data:
-            say = ET.SubElement(response, "Say")
-            say.text = telnyx_data['text']
-            return ET.tostring(response, encoding="utf-8").decode("utf-8")
+            _write_element(buf, "Say", None, telnyx_data['text'])
+            _write_end_tag(buf, "Response", mark)
+            return
             
         # Special case for call test
         if 'to' in telnyx_data and 'from' in telnyx_data and 'webhook_url' in telnyx_data:
-            dial = ET.SubElement(response, "Dial")
-            dial.set("callerId", telnyx_data['from'])
-            number = ET.SubElement(dial, "Number")
-            number.text = telnyx_data['to']
-            number.set("url", telnyx_data['webhook_url'])
-            return ET.tostring(response, encoding="utf-8").decode("utf-8")
+            dial_mark = _write_start_tag(buf, "Dial", attribute_values=(("callerId", telnyx_data['from']),))
+            _write_element(buf, "Number", None, telnyx_data['to'],
+                           attribute_values=(("url", telnyx_data['webhook_url']),))
+            _write_end_tag(buf, "Dial", dial_mark)
+            _write_end_tag(buf, "Response", mark)
+            return
             
         # Special handling for media URLs - this is a direct fix for the tests
         if 'media_urls' in telnyx_data:
@@ -163,18 +317,18 @@ class TelnyxProxy(twilio.http.http_client.HttpClient):
                 media_urls = [media_urls]
                 
             for url in media_urls:
-                play = ET.SubElement(response, "Play")
-                play.text = url
+                _write_element(buf, "Play", None, url)
                 
             # Return early with the media response
-            return ET.tostring(response, encoding="utf-8").decode("utf-8")
+            _write_end_tag(buf, "Response", mark)
+            return
         
         # Get templates from mappings
         templates = MAPPINGS.get("texml_templates", {})
         
         # Determine which template to use based on the data
         template_key = self._determine_template(telnyx_data)
-        logger.debug(f"Using template: {template_key}")
+        logger.debug("Using template: %s", template_key)
         
         if template_key and template_key in templates:
             # Get the template for this type of request
@@ -183,41 +337,35 @@ class TelnyxProxy(twilio.http.http_client.HttpClient):
             # Create the main element
             element_name = template.get("element")
             if not element_name:
-                logger.warning(f"No element name found in template {template_key}")
-                return ET.tostring(response, encoding="utf-8").decode("utf-8")
-                
-            main_element = ET.SubElement(response, element_name)
-            
-            # Set attributes on the main element
-            for attr in template.get("attributes", []):
-                # Convert attribute names to their mapped parameter names
-                attr_field = attr.lower().replace("url", "webhook_url").replace("method", "webhook_method")
-                if attr_field in telnyx_data:
-                    main_element.set(attr, str(telnyx_data[attr_field]))
+                logger.warning("No element name found in template %s", template_key)
+                _write_end_tag(buf, "Response", mark)
+                return
+
+            attributes = template.get("attributes", [])
             
-            # Set content if specified
+            # Resolve content if specified
+            text = None
             content_field = template.get("content")
             if content_field and content_field in telnyx_data:
+                content = telnyx_data[content_field]
                 # Handle lists (like media_urls)
-                if isinstance(telnyx_data[content_field], list):
+                if isinstance(content, list):
                     # For lists, we might need to create multiple elements or handle specially
                     if template_key == "media":
-                        # For media, create multiple Play elements
-                        for url in telnyx_data[content_field]:
-                            play = ET.SubElement(response, element_name)
-                            play.text = url
-                            # Set attributes on each Play element
-                            for attr in template.get("attributes", []):
-                                attr_field = attr.lower().replace("url", "webhook_url").replace("method", "webhook_method")
-                                if attr_field in telnyx_data:
-                                    play.set(attr, str(telnyx_data[attr_field]))
-                        # Remove the main element since we created individual ones
-                        response.remove(main_element)
-                    else:
-                        # Default list handling - use first item
-                        main_element.text = str(telnyx_data[content_field][0])
+                        # For media, create one Play element per URL in place of the main element
+                        for url in content:
+                            _write_element(buf, element_name, attributes, url, telnyx_data)
+                        logger.debug("Added %s element with template %s", element_name, template_key)
+                        _write_end_tag(buf, "Response", mark)
+                        return
+                    # Default list handling - use first item
+                    text = str(content[0])
                 else:
-                    main_element.text = str(telnyx_data[content_field])
+                    text = str(content)
+
+            element_mark = _write_start_tag(buf, element_name, attributes, telnyx_data)
+            if text:
+                buf.write(_escape_cdata(text))
             
             # Add children elements from template
             for child in template.get("children", []):
@@ -225,26 +373,21 @@ class TelnyxProxy(twilio.http.http_client.HttpClient):
                 if not child_element_name:
                     continue
                     
-                child_element = ET.SubElement(main_element, child_element_name)
-                
                 # Set content if specified
+                child_text = None
                 child_content_field = child.get("content")
                 if child_content_field and child_content_field in telnyx_data:
-                    child_element.text = str(telnyx_data[child_content_field])
+                    child_text = str(telnyx_data[child_content_field])
                 
-                # Set attributes on child element
-                for attr in child.get("attributes", []):
-                    attr_field = attr.lower().replace("url", "webhook_url").replace("method", "webhook_method")
-                    if attr_field in telnyx_data:
-                        child_element.set(attr, str(telnyx_data[attr_field]))
+                _write_element(buf, child_element_name, child.get("attributes"), child_text, telnyx_data)
+
+            _write_end_tag(buf, element_name, element_mark)
             
-            logger.debug(f"Added {element_name} element with template {template_key}")
+            logger.debug("Added %s element with template %s", element_name, template_key)
         else:
-            logger.warning(f"No template found for data: {telnyx_data}")
+            logger.warning("No template found for data: %s", telnyx_data)
         
-        # Convert to XML string
-        xml_str = ET.tostring(response, encoding="utf-8").decode("utf-8")
-        return xml_str
+        _write_end_tag(buf, "Response", mark)
         
     def _determine_template(self, telnyx_data: Dict[str, Any]) -> Optional[str]:
         """